@@ -0,0 +1,69 @@
+package fr.uga.pddl4j.examples.satplanner;
+
+import picocli.CommandLine;
+
+import java.io.BufferedReader;
+import java.io.IOException;
+import java.io.InputStreamReader;
+import java.nio.charset.StandardCharsets;
+
+/**
+ * Runs SATP on a stream of problems within a single JVM.
+ *
+ * <p>Once started, the server prints {@link #READY} on its own line. Each line then read on the standard
+ * input holds a domain file and a problem file separated by a tab. The problem is solved exactly as with the
+ * SATP command line, then a line made of {@link #END_OF_REPLY}, a space and the exit code of the run is
+ * printed; the exit code is not 0 if the run failed. The server stops when the standard input is closed. It
+ * follows the same protocol as the HSP server, so both planners are timed on the same basis.</p>
+ */
+public final class SATPServer {
+
+    /**
+     * The line printed once the server is ready to read problems.
+     */
+    public static final String READY = "<<<READY>>>";
+
+    /**
+     * The marker starting the line printed once the output of a problem is complete.
+     */
+    public static final String END_OF_REPLY = "<<<END>>>";
+
+    /**
+     * Creates a new server. This class only exposes {@link #main(String[])}.
+     */
+    private SATPServer() {
+    }
+
+    /**
+     * Reads problems from the standard input until it is closed and solves them one at a time.
+     *
+     * @param args the command line arguments, unused.
+     * @throws IOException if the standard input cannot be read.
+     */
+    public static void main(final String[] args) throws IOException {
+        final BufferedReader in = new BufferedReader(new InputStreamReader(System.in, StandardCharsets.UTF_8));
+        // Load the planner and command line classes before reporting ready
+        new CommandLine(new SATP());
+        System.out.println(SATPServer.READY);
+        System.out.flush();
+        String line;
+        while ((line = in.readLine()) != null) {
+            final String[] files = line.split("\t");
+            int status;
+            if (files.length == 2) {
+                try {
+                    status = new CommandLine(new SATP()).execute(files[0], files[1]);
+                } catch (Exception e) {
+                    // Report the failure and keep serving the next problems
+                    e.printStackTrace();
+                    status = 1;
+                }
+            } else {
+                System.err.println("Expected \"<domain>\\t<problem>\", got: " + line);
+                status = 2;
+            }
+            System.out.println(SATPServer.END_OF_REPLY + " " + status);
+            System.out.flush();
+        }
+    }
+}
@@ -1,9 +1,18 @@
+import argparse
+import atexit
+import hashlib
+import heapq
+import json
 import subprocess
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
 import time
-import matplotlib.pyplot as plt
 import re
-from matplotlib.ticker import LogFormatter
+import shutil
+import signal
+import threading
+import zipfile
 
 
 # Define benchmark domains and paths
@@ -15,27 +24,87 @@ BENCHMARKS = {
     
 }
 
+# Resolve executables once instead of letting every spawn search the PATH.
+# The Maven daemon is preferred when installed as it keeps Maven warm.
+JAVA = shutil.which("java") or "java"
+MVN = shutil.which("mvnd") or shutil.which("mvn.cmd" if os.name == "nt" else "mvn") or "mvn"
+
+# Both planners run in long-lived JVMs with the same flags, so their runtimes
+# compare fairly: the default tiered JIT (reaching C2 code) and collector,
+# with class data sharing to speed up their start
+JVM_OPTS = ["-Xshare:auto"]
+
 # Planner settings
 SAT_PLANNER_DIR = "sat"
+SAT_PLANNER_JAR = os.path.abspath(os.path.join(SAT_PLANNER_DIR, "target/satp.jar"))
+SAT_SERVER_CMD = [JAVA, *JVM_OPTS, "-cp", SAT_PLANNER_JAR, "fr.uga.pddl4j.examples.satplanner.SATPServer"]
 HSP_PLANNER_DIR = "hsp"
 HSP_PLANNER_JAR = os.path.join(HSP_PLANNER_DIR, "build/libs/pddl4j-4.0.0.jar")
-HSP_PLANNER_CMD = ["java", "-cp", HSP_PLANNER_JAR, "fr.uga.pddl4j.planners.statespace.HSP"]
+HSP_SERVER_CMD = [JAVA, *JVM_OPTS, "-cp", HSP_PLANNER_JAR, "fr.uga.pddl4j.planners.statespace.HSPServer"]
+# Each planner runs in long-lived JVMs that print PLANNER_SERVER_READY once
+# started, then read "<domain>\t<problem>" lines and print each plan followed
+# by "PLANNER_SERVER_END <exit code>" (see SATPServer.java and HSPServer.java).
+# Maps each planner to its server command and working directory.
+PLANNER_SERVERS = {
+    "HSP": (HSP_SERVER_CMD, None),
+    "SAT": (SAT_SERVER_CMD, SAT_PLANNER_DIR)
+}
+PLANNER_SERVER_READY = "<<<READY>>>"
+PLANNER_SERVER_END = "<<<END>>>"
+
+PLANNER_TIMEOUT = 600  # seconds
+KILL_GRACE_PERIOD = 5  # seconds between SIGTERM and SIGKILL
+SERVER_START_TIMEOUT = 120  # seconds for a planner server to become ready
+
+# Set SATPLANNER_DEBUG=1 to let planner servers write their stderr to the terminal
+DEBUG = bool(os.environ.get("SATPLANNER_DEBUG"))
+
+# Results of previous runs, reused until a PDDL file or a planner jar
+# changes (see --force)
+CACHE_PATH = "results_cache.json"
+
+# Plan steps are printed as "<step>: <action>"
+_STEP_RE = re.compile(r'[ \t]*(\d+):')
+
+# Popen arguments shared by every planner process. Leaving out preexec_fn
+# and uid/gid changes lets CPython spawn with vfork, which skips copying
+# this process's page tables.
+PLANNER_POPEN_ARGS = {
+    "shell": False,
+    "text": True,
+    # A stray byte in planner output must not abort reading the plan
+    "errors": "replace",
+    "bufsize": 1,
+    # Isolate the planner so a timeout can stop its whole process tree
+    "start_new_session": os.name != "nt",
+    "creationflags": subprocess.CREATE_NEW_PROCESS_GROUP if os.name == "nt" else 0
+}
 
 ALL_RESULTS = {}
 
+# Planner processes running in this process. They sit in their own sessions,
+# so Ctrl-C does not reach them and they have to be stopped from here.
+_live_planners = set()
+_live_planners_lock = threading.Lock()
+_stopping = threading.Event()
+
+# One server per planner and thread, so concurrent runs never share a JVM
+_server_local = threading.local()
+_planner_servers = []
+_planner_servers_lock = threading.Lock()
+
 def compile_projects():
     """Compile both projects once at the beginning"""
     print("Compiling SAT planner (Maven)...")
     try:
-        mvn_executable = "mvn.cmd" if os.name == "nt" else "mvn"
         subprocess.run(
-            [mvn_executable, "compile"],
+            [MVN, "-q", "package"],
             cwd=SAT_PLANNER_DIR,
             check=True,
-            shell=True  # Added shell=True for Windows
+            shell=False
         )
         print("SAT planner compiled successfully")
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, OSError) as e:
         print(f"Error compiling SAT planner: {e}")
         return False
     
@@ -54,17 +123,13 @@ def compile_projects():
             
         print(f"Using Gradle wrapper at: {gradle_path}")
         
-        # For Windows, we need to run the batch file differently
-        if os.name == 'nt':
-            cmd = f'"{gradle_path}" build'
-        else:
-            cmd = [gradle_path, "build"]
-        
+        # Batch files run fine without cmd.exe when given by absolute path.
+        # Only the jar is needed, so skip the PDDL4J test suite and checkstyle.
         subprocess.run(
-            cmd,
+            [gradle_path, "build", "-PnoTest", "-PnoCheckStyle"],
             cwd=HSP_PLANNER_DIR,
             check=True,
-            shell=True  # Important for Windows batch files
+            shell=False
         )
         print("HSP planner compiled successfully")
         return True
@@ -77,42 +142,223 @@ def compile_projects():
         print(f"Unexpected error compiling HSP planner: {e}")
         return False
         
-def run_planner(planner_type, domain_file, problem_file):
-    start = time.time()
+@lru_cache(maxsize=None)
+def planner_version(jar_path):
+    """Fingerprint a planner jar by the CRCs of its entries
+
+    Unlike the jar's mtime, this stays the same when the build tools rewrite
+    an unchanged jar, which compile_projects does at every run.
+    """
+    digest = hashlib.sha1()
+    with zipfile.ZipFile(jar_path) as jar:
+        for info in jar.infolist():
+            digest.update(f"{info.filename}:{info.CRC}\n".encode())
+    return digest.hexdigest()
+
+def cache_key(planner_type, domain_file, problem_file):
+    """Identify a run by its inputs, so editing a PDDL file or a planner invalidates it"""
+    jar_path = HSP_PLANNER_JAR if planner_type == "HSP" else SAT_PLANNER_JAR
+    return "|".join([
+        planner_type,
+        planner_version(jar_path),
+        domain_file,
+        problem_file,
+        str(os.path.getmtime(domain_file)),
+        str(os.path.getmtime(problem_file))
+    ])
+
+def load_cache():
+    """Load cached results, starting afresh if the file is missing or corrupt"""
     try:
-        if planner_type == "HSP":
-            cmd = HSP_PLANNER_CMD + [domain_file, problem_file]
-            cwd = None  # Use project root for HSP
+        with open(CACHE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
 
-        elif planner_type == "SAT":
-            mvn_executable = "mvn.cmd" if os.name == "nt" else "mvn"
-            relative_domain_path = os.path.relpath(domain_file, SAT_PLANNER_DIR)
-            relative_problem_path = os.path.relpath(problem_file, SAT_PLANNER_DIR)
-            cmd = [
-                mvn_executable,
-                "exec:java",
-                "-Dexec.mainClass=fr.uga.pddl4j.examples.satplanner.SATP",  
-                f"-Dexec.args={relative_domain_path} {relative_problem_path}"
-            ]
-            cwd = SAT_PLANNER_DIR
+def save_cache(cache):
+    """Write the cache atomically so an interrupted run cannot corrupt it"""
+    tmp_path = CACHE_PATH + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(cache, f, indent=2)
+    os.replace(tmp_path, CACHE_PATH)
 
-        else:
-            raise ValueError("Invalid planner type")
-        
-        print(f"\n[Running {planner_type}]")
-        result = subprocess.run(
+def kill_process_tree(proc):
+    """Stop a planner together with any process it started"""
+    if os.name == "nt":
+        subprocess.run(
+            ["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        return
+
+    # The planner leads its own session, so its pid is also its group id
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        return
+    try:
+        proc.wait(timeout=KILL_GRACE_PERIOD)
+    except subprocess.TimeoutExpired:
+        pass
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+def track_planner(proc):
+    """Register a started planner, or stop it at once if the run is being interrupted"""
+    with _live_planners_lock:
+        if not _stopping.is_set():
+            _live_planners.add(proc)
+            return
+    kill_process_tree(proc)
+
+def untrack_planner(proc):
+    """Forget a planner that has exited or been shut down"""
+    with _live_planners_lock:
+        _live_planners.discard(proc)
+
+def kill_all_planners():
+    """Stop every planner of this process, including ones started from now on"""
+    with _live_planners_lock:
+        _stopping.set()
+        planners = list(_live_planners)
+        _live_planners.clear()
+    for proc in planners:
+        kill_process_tree(proc)
+
+def planner_server(planner_type):
+    """Return this thread's server for a planner, starting it and waiting until it is ready if needed"""
+    servers = getattr(_server_local, "servers", None)
+    if servers is None:
+        servers = _server_local.servers = {}
+    server = servers.get(planner_type)
+    if server is None or server.poll() is not None:
+        cmd, cwd = PLANNER_SERVERS[planner_type]
+        server = subprocess.Popen(
             cmd,
             cwd=cwd,
+            stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            timeout=600
+            stderr=None if DEBUG else subprocess.DEVNULL,
+            **PLANNER_POPEN_ARGS
         )
+        track_planner(server)
+        servers[planner_type] = server
+        with _planner_servers_lock:
+            _planner_servers.append(server)
+        # Startup happens before the clock, out of PLANNER_TIMEOUT's reach,
+        # so a JVM hanging there needs its own timeout
+        timer = threading.Timer(SERVER_START_TIMEOUT, kill_process_tree, (server,))
+        timer.start()
+        try:
+            # The JVM may print its own warnings to stdout before the marker
+            for line in server.stdout:
+                if line.rstrip() == PLANNER_SERVER_READY:
+                    break
+            else:
+                raise EOFError(f"{planner_type} server exited or timed out before it was ready")
+        except BaseException:
+            kill_process_tree(server)
+            raise
+        finally:
+            timer.cancel()
+    return server
+
+def stop_planner_servers():
+    """Shut down the planner servers started by this process"""
+    with _planner_servers_lock:
+        servers = _planner_servers[:]
+        _planner_servers.clear()
+    for server in servers:
+        try:
+            server.stdin.close()  # the server exits at the end of its input
+            server.wait(timeout=KILL_GRACE_PERIOD)
+        except (OSError, subprocess.TimeoutExpired):
+            kill_process_tree(server)
+        server.stdout.close()
+        untrack_planner(server)
+
+atexit.register(stop_planner_servers)
+
+def read_reply(server):
+    """Yield the output lines of one problem, up to the server's end marker
+
+    The marker carries the planner's exit code, and a failed problem raises
+    CalledProcessError once its whole reply has been read.
+    """
+    for line in server.stdout:
+        if line.startswith(PLANNER_SERVER_END):
+            status = int(line[len(PLANNER_SERVER_END):])
+            if status != 0:
+                raise subprocess.CalledProcessError(status, server.args)
+            return
+        yield line
+    raise EOFError("Planner server exited before finishing the problem")
+
+def solve_with_server(server, domain_file, problem_file):
+    """Solve one problem on a ready planner server and return its makespan"""
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        kill_process_tree(server)
+
+    timer = threading.Timer(PLANNER_TIMEOUT, kill)
+    timer.start()
+    try:
+        server.stdin.write(f"{domain_file}\t{problem_file}\n")
+        server.stdin.flush()
+        reply = read_reply(server)
+        makespan = extract_makespan(reply)
+        # Consume the rest of the reply so the next problem starts clean
+        for _ in reply:
+            pass
+    except subprocess.CalledProcessError:
+        # The planner failed on this problem, but the server is in sync and reusable
+        raise
+    except BaseException:
+        # The server is replaced on the next call
+        kill_process_tree(server)
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(server.args, PLANNER_TIMEOUT) from None
+        raise
+    finally:
+        timer.cancel()
+    return makespan
+
+def run_planner(planner_type, domain_file, problem_file, cache=None, relative_domain_path=None):
+    try:
+        if cache is not None:
+            key = cache_key(planner_type, domain_file, problem_file)
+            if key in cache:
+                runtime, makespan = cache[key]
+                print(f"[{planner_type}] {problem_file}: cached runtime {runtime}, makespan {makespan}")
+                return runtime, makespan
+
+        if planner_type == "HSP":
+            planner_args = (domain_file, problem_file)
+        elif planner_type == "SAT":
+            # The SAT server runs in the SAT project, so paths are relative to it
+            if relative_domain_path is None:
+                relative_domain_path = os.path.relpath(domain_file, SAT_PLANNER_DIR)
+            planner_args = (relative_domain_path, os.path.relpath(problem_file, SAT_PLANNER_DIR))
+        else:
+            raise ValueError("Invalid planner type")
+
+        # Start or restart this thread's server before the clock, so no
+        # runtime includes JVM startup
+        server = planner_server(planner_type)
+
+        start = time.time()
+        print(f"[Running {planner_type}] {problem_file}")
+        makespan = solve_with_server(server, *planner_args)
 
-        output = result.stdout.decode()
         runtime = time.time() - start
-        makespan = extract_makespan(output)
-        print(f"runtime {runtime}")
-        print(f"makespan {makespan}")
+        print(f"[{planner_type}] {problem_file}: runtime {runtime}, makespan {makespan}")
+        if cache is not None:
+            cache[key] = [runtime, makespan]
         return runtime, makespan
 
     except subprocess.TimeoutExpired:
@@ -122,12 +368,23 @@ def run_planner(planner_type, domain_file, problem_file):
         print(f"Error running {planner_type} on {problem_file}: {e}")
         return None, None
 
-def extract_makespan(output):
+def extract_makespan(lines):
+    """Return the plan length from the output lines of a planner
+
+    Only the first block of numbered steps counts: lines are consumed up to
+    the blank line closing it, and any later numbered lines are ignored.
+    """
     max_step = -1
-    step_pattern = re.compile(r'^(\d+):')
 
-    for line in output.splitlines():
-        match = step_pattern.match(line.strip())
+    for line in lines:
+        # Most lines are logs without a colon; skip them before the regex
+        if ':' not in line:
+            # The plan is printed as one block of steps closed by a blank
+            # line, after which only statistics follow
+            if max_step >= 0 and not line.strip():
+                break
+            continue
+        match = _STEP_RE.match(line)
         if match:
             step_num = int(match.group(1))
             if step_num > max_step:
@@ -135,9 +392,11 @@ def extract_makespan(output):
 
     return max_step + 1 if max_step >= 0 else None
 
-def compare_domain(domain_name, domain_path):
+def compare_domain(domain_name, domain_path, max_workers=None, cache=None):
     print(f"\nComparing planners on: {domain_name}")
     domain_file = os.path.join(domain_path, "domain.pddl")
+    # Shared by every SAT run of the domain, so compute it once
+    relative_domain_path = os.path.relpath(domain_file, SAT_PLANNER_DIR)
     domain_limits = {
         "blocksworld": 10,
         "gripper": 4,
@@ -145,34 +404,96 @@ def compare_domain(domain_name, domain_path):
         "logistics": 2
     }
     limit = domain_limits.get(domain_name, 5)  # default to 5 if domain not in dict
-    problem_files = sorted(f for f in os.listdir(domain_path) if f.startswith("p"))[:limit]
+    # Only the first `limit` names are needed, so avoid sorting the whole directory
+    with os.scandir(domain_path) as entries:
+        problem_files = heapq.nsmallest(
+            limit, (e.name for e in entries if e.is_file() and e.name.startswith("p"))
+        )
     results = {"HSP": [], "SAT": []}
 
-    for problem_file in problem_files:
-        problem_path = os.path.join(domain_path, problem_file)
-        print(f"   Problem: {problem_file}")
+    # Planners run as independent subprocesses, so threads are enough to
+    # overlap them: subprocess waits release the GIL.
+    _stopping.clear()
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            try:
+                futures = {}
+                for problem_file in problem_files:
+                    problem_path = os.path.join(domain_path, problem_file)
+                    for planner_type in results:
+                        futures[(planner_type, problem_file)] = executor.submit(
+                            run_planner, planner_type, domain_file, problem_path, cache, relative_domain_path
+                        )
+
+                # Collect in submission order so results follow problem_files
+                for (planner_type, problem_file), future in futures.items():
+                    runtime, makespan = future.result()
+                    results[planner_type].append((problem_file, runtime, makespan))
+            except KeyboardInterrupt:
+                # Ctrl-C only reaches this thread, not the pool threads nor
+                # the planners, so drop queued runs and stop the running ones
+                executor.shutdown(wait=False, cancel_futures=True)
+                kill_all_planners()
+                raise
+    finally:
+        # Process pool workers exit without running atexit handlers
+        stop_planner_servers()
+
+    return domain_name, results, cache
+
+def compare_domain_wrap(benchmark, cache=None):
+    """Process pool entry point: run one (name, path) item of BENCHMARKS"""
+    name, path = benchmark
+    # Every domain runs in its own process, so share the CPUs between them
+    # instead of letting each inner pool oversubscribe the machine
+    max_workers = max(1, (os.cpu_count() or 1) // len(BENCHMARKS))
+    return compare_domain(name, os.path.normpath(path), max_workers, cache)
 
-        hsp_runtime, hsp_makespan = run_planner("HSP", domain_file, problem_path)
-        sat_runtime, sat_makespan = run_planner("SAT", domain_file, problem_path)
+def plot_comparison(ax, problem_names, hsp_values, sat_values, title, xlabel, ylabel):
+    """Draw the HSP and SAT curves of one metric on an axis"""
+    ax.plot(problem_names, hsp_values, marker="o", label="HSP")
+    ax.plot(problem_names, sat_values, marker="x", label="SAT Planner")
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.legend()
+    ax.tick_params(axis="x", rotation=45)
 
-        results["HSP"].append((problem_file, hsp_runtime, hsp_makespan))
-        results["SAT"].append((problem_file, sat_runtime, sat_makespan))
+def plot_results(per_domain=False):
+    """Save every domain in figures/summary.png, plus one PNG per domain and metric if asked"""
+    if not ALL_RESULTS:
+        return
 
-    ALL_RESULTS[domain_name] = results
+    # Plotting libraries are only imported once every planner has run, so
+    # domain workers and planner spawns do not carry their memory footprint.
+    # Keep matplotlib's font cache in a known writable place so it is built once.
+    os.environ.setdefault("MPLCONFIGDIR", ".mpl_cache")
+    import matplotlib
+    matplotlib.use("Agg")  # figures are only written to PNG, skip GUI backend probing
+    import matplotlib.pyplot as plt
+    import numpy as np
 
-def plot_results():
     os.makedirs("figures", exist_ok=True)
 
+    summary = []
+
     for domain_name, results in ALL_RESULTS.items():
         sorted_hsp = sorted(results["HSP"], key=lambda x: (x[1] if x[1] is not None else float("inf")))
         problem_names = [x[0] for x in sorted_hsp]
         sat_dict = {x[0]: x for x in results["SAT"]}
 
-        hsp_runtimes = [x[1] for x in sorted_hsp]
-        sat_runtimes = [sat_dict[name][1] if name in sat_dict else None for name in problem_names]
+        # Float arrays turn missing results (None) into NaN, which matplotlib
+        # leaves out of the curves
+        hsp_runtimes = np.array([x[1] for x in sorted_hsp], dtype=float)
+        sat_runtimes = np.array([sat_dict[name][1] if name in sat_dict else None for name in problem_names], dtype=float)
+
+        hsp_makespans = np.array([x[2] for x in sorted_hsp], dtype=float)
+        sat_makespans = np.array([sat_dict[name][2] if name in sat_dict else None for name in problem_names], dtype=float)
 
-        hsp_makespans = [x[2] for x in sorted_hsp]
-        sat_makespans = [sat_dict[name][2] if name in sat_dict else None for name in problem_names]
+        summary.append((domain_name, problem_names, hsp_runtimes, sat_runtimes, hsp_makespans, sat_makespans))
+
+        if not per_domain:
+            continue
 
         # Runtime plot
         plt.figure(figsize=(10, 8))  # Taille de la figure
@@ -191,26 +512,47 @@ def plot_results():
         plt.close()
 
         # Makespan plot
-        plt.subplot(2, 1, 2)        
-        plt.plot(problem_names, hsp_makespans, marker="o", label="HSP")
-        plt.plot(problem_names, sat_makespans, marker="x", label="SAT Planner")
-        plt.title(f"Makespan - {domain_name}")
-        plt.xlabel("Problem (makespan comparison)")
-        plt.ylabel("Plan Length")
-        plt.legend()
-        plt.xticks(rotation=45)
-        plt.tight_layout(rect=[0, 0, 1, 0.96])
-        plt.savefig(f"figures/{domain_name}_makespan.png")
-        plt.close()
+        fig, ax = plt.subplots(figsize=(10, 4))
+        plot_comparison(ax, problem_names, hsp_makespans, sat_makespans,
+                        f"Makespan - {domain_name}", "Problem (makespan comparison)", "Plan Length")
+        fig.tight_layout()
+        fig.savefig(f"figures/{domain_name}_makespan.png")
+        plt.close(fig)
+
+    # One figure for all domains: a row per domain, runtime left, makespan right
+    fig, axes = plt.subplots(len(summary), 2, figsize=(16, 4 * len(summary)), squeeze=False)
+    for row, (domain_name, problem_names, hsp_runtimes, sat_runtimes, hsp_makespans, sat_makespans) in zip(axes, summary):
+        plot_comparison(row[0], problem_names, hsp_runtimes, sat_runtimes,
+                        f"Runtime - {domain_name}", "Problem (runtime comparison)", "Time (s)")
+        plot_comparison(row[1], problem_names, hsp_makespans, sat_makespans,
+                        f"Makespan - {domain_name}", "Problem (makespan comparison)", "Plan Length")
+    fig.tight_layout()
+    fig.savefig("figures/summary.png")
+    plt.close(fig)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the HSP and SAT planners")
+    parser.add_argument("--force", action="store_true",
+                        help=f"rerun every planner instead of reusing {CACHE_PATH}")
+    parser.add_argument("--no-compile", action="store_true",
+                        help="reuse the planner jars from a previous build")
+    parser.add_argument("--per-domain-plots", action="store_true",
+                        help="also save separate runtime and makespan plots for each domain")
+    args = parser.parse_args()
+
     # Compile both projects first
-    if not compile_projects():
+    if not args.no_compile and not compile_projects():
         print("Compilation failed, exiting...")
         exit(1)
     
-    # Run benchmarks
-    for name, path in BENCHMARKS.items():
-        compare_domain(name, os.path.normpath(path))
-    plot_results()
+    # Run benchmarks, one worker process per domain. Workers fill a copy of
+    # the cache and hand it back, so only this process writes the file.
+    cache = load_cache()
+    run_domain = partial(compare_domain_wrap, cache={} if args.force else cache)
+    with ProcessPoolExecutor(max_workers=len(BENCHMARKS)) as executor:
+        for name, results, domain_cache in executor.map(run_domain, BENCHMARKS.items()):
+            ALL_RESULTS[name] = results
+            cache.update(domain_cache)
+            save_cache(cache)
+    plot_results(per_domain=args.per_domain_plots)
     print("\nAll comparisons done. Figures saved in 'figures/' folder.")
\ No newline at end of file